@@ -1,8 +1,12 @@
 import math
 import sys
+from collections import OrderedDict
 from pathlib import Path
 
+import orjson
 import pytest
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
 
 ROOT_DIR = Path(__file__).resolve().parent.parent
 if str(ROOT_DIR) not in sys.path:
@@ -12,10 +16,13 @@ from webapp import app
 from webapp.app import (
     ExpenseInputs,
     FutureAssumptions,
+    LienComponentInput,
     ScenarioInput,
     CalculationRequest,
+    CalculationResponse,
     _equity_built,
     _merge_component_schedules,
+    _monthly_net_cash,
     _net_cashflow,
     calculate_mortgage,
 )
@@ -27,6 +34,8 @@ from webapp.mortgage_calculator import (
     total_interest,
 )
 
+app_module = sys.modules["webapp.app"]
+
 
 def test_calculate_monthly_payment_zero_interest():
     scenario = MortgageScenario(term_years=30, annual_interest_rate=0)
@@ -46,6 +55,19 @@ def test_generate_schedule_sums_to_loan():
     )
 
 
+def test_schedule_rows_and_slices_match_columns():
+    scenario = MortgageScenario(term_years=5, annual_interest_rate=4)
+    schedule = generate_amortization_schedule(50_000, scenario)
+    assert len(schedule) == 60
+    row = schedule[10]
+    assert row.payment_number == 11
+    assert row.interest == schedule.interest[10]
+    window = schedule[12:24]
+    assert len(window) == 12
+    assert [p.payment_number for p in window] == list(range(13, 25))
+    assert list(window.balance) == list(schedule.balance[12:24])
+
+
 def test_summarize_scenarios_includes_all_inputs():
     scenarios = [
         MortgageScenario(term_years=10, annual_interest_rate=4.5),
@@ -59,6 +81,17 @@ def test_summarize_scenarios_includes_all_inputs():
         assert interest > 0
 
 
+def test_summarize_scenarios_matches_schedule_totals():
+    scenarios = [
+        MortgageScenario(term_years=15, annual_interest_rate=5.5),
+        MortgageScenario(term_years=30, annual_interest_rate=0),
+    ]
+    for scenario, payment, interest in summarize_scenarios(250_000, scenarios):
+        schedule = generate_amortization_schedule(250_000, scenario)
+        assert payment == pytest.approx(schedule[0].payment)
+        assert interest == pytest.approx(total_interest(schedule), abs=1e-6)
+
+
 def test_equity_and_cashflow_helpers():
     scenario = MortgageScenario(term_years=5, annual_interest_rate=4)
     schedule = generate_amortization_schedule(50_000, scenario)
@@ -88,6 +121,31 @@ def test_merge_component_schedules_combines_series():
         )
 
 
+def test_merge_component_schedules_pads_shorter_terms():
+    schedule_a = generate_amortization_schedule(
+        40_000, MortgageScenario(term_years=10, annual_interest_rate=4)
+    )
+    schedule_b = generate_amortization_schedule(
+        20_000, MortgageScenario(term_years=5, annual_interest_rate=3)
+    )
+    merged = _merge_component_schedules([schedule_a, schedule_b])
+    assert len(merged) == len(schedule_a)
+    assert merged[59].payment == pytest.approx(schedule_a[59].payment + schedule_b[59].payment)
+    assert merged[60].payment == pytest.approx(schedule_a[60].payment)
+    assert merged[-1].balance == pytest.approx(0, abs=1e-6)
+
+
+def test_monthly_net_cash_applies_yearly_income_and_payoff():
+    payments = [1000.0] * 18
+    net_cash = _monthly_net_cash(payments, yearly_operating_income=[1500.0, 1584.0])
+    assert len(net_cash) == 24
+    assert net_cash[0] == pytest.approx(500.0)
+    assert net_cash[12] == pytest.approx(584.0)
+    assert net_cash[18] == pytest.approx(1584.0)
+    no_income = _monthly_net_cash(payments, yearly_operating_income=[0.0, 0.0])
+    assert no_income == [-1000.0] * 18 + [0.0] * 6
+
+
 def test_expense_inputs_monthly_calculation():
     expenses = ExpenseInputs(
         property_taxes_annual=6000,
@@ -142,6 +200,13 @@ def test_scenario_input_validation():
         )
 
 
+def test_lien_requires_amount_or_percent():
+    with pytest.raises(ValueError):
+        LienComponentInput(term_years=30, annual_interest_rate=6.0)
+    lien = LienComponentInput(amount=100_000, term_years=30, annual_interest_rate=6.0)
+    assert lien.percent_of_value is None
+
+
 def test_calculate_mortgage_with_expenses():
     request = CalculationRequest(
         purchase_price=500_000,
@@ -192,6 +257,8 @@ def test_calculate_mortgage_with_expenses():
     assert first.monthly_payment > 0
     assert first.cash_to_close > first.down_payment_amount  # closing costs added
     assert math.isfinite(first.cash_on_cash_return)
+    assert first.schedule.payment_number == list(range(1, 13))
+    assert len(first.schedule.balance) == 12
     stacked = response.scenarios[1]
     assert len(stacked.components) == 2
     assert stacked.components[0].label == "Lien 1"
@@ -352,3 +419,149 @@ def test_property_appreciation_boosts_year_one_equity():
     base_equity = base_response.scenarios[0].year_one_equity
     elevated_equity = elevated_response.scenarios[0].year_one_equity
     assert elevated_equity > base_equity
+
+
+@pytest.fixture
+def response_cache(monkeypatch):
+    cache = OrderedDict()
+    monkeypatch.setattr(app_module, "_response_cache", cache)
+    monkeypatch.setattr(app_module, "_response_cache_bytes", 0)
+    return cache
+
+
+def post_calculation(client: TestClient, payload: dict | bytes):
+    content = payload if isinstance(payload, bytes) else orjson.dumps(payload)
+    return client.post(
+        "/api/calculate",
+        content=content,
+        headers={"Content-Type": "application/json"},
+    )
+
+
+def test_calculate_endpoint_body_matches_model_dict(response_cache):
+    payload = {
+        "purchase_price": 420_000,
+        "monthly_rent": 3600,
+        "expenses": {"hoa_monthly": 75, "vacancy_percent": 5},
+        "future_assumptions": {
+            "annual_property_appreciation_percent": 3,
+            "annual_rent_growth_percent": 2,
+            "annual_expense_inflation_percent": 1.5,
+        },
+        "outlook_years": [1, 7, 40],
+        "schedule_limit": 24,
+        "scenarios": [
+            {
+                "label": "Stacked",
+                "liens": [
+                    {"percent_of_value": 60, "term_years": 30, "annual_interest_rate": 6.5},
+                    {"amount": 50_000, "term_years": 10, "annual_interest_rate": 0},
+                ],
+            }
+        ],
+    }
+    response = post_calculation(TestClient(app), payload)
+    assert response.status_code == 200
+    expected = calculate_mortgage(CalculationRequest(**payload)).dict()
+    assert response.json() == orjson.loads(orjson.dumps(expected))
+
+
+def assert_float_fields(model, data: dict) -> None:
+    for name, field in model.__fields__.items():
+        value = data[name]
+        if field.outer_type_ is float:
+            assert isinstance(value, float) or (value is None and field.allow_none), name
+        elif field.type_ is float:
+            assert all(isinstance(item, float) for item in value), name
+        elif isinstance(field.type_, type) and issubclass(field.type_, BaseModel):
+            for item in value if isinstance(value, list) else [value]:
+                assert_float_fields(field.type_, item)
+
+
+def test_calculate_endpoint_returns_floats_for_default_inputs(response_cache):
+    response = post_calculation(TestClient(app), {})
+    assert response.status_code == 200
+    body = response.json()
+    assert body["loan_amount"] == 500_000.0
+    assert_float_fields(CalculationResponse, body)
+
+
+def test_calculate_endpoint_serves_cached_bytes(response_cache, monkeypatch):
+    client = TestClient(app)
+    first = post_calculation(client, {"monthly_rent": 3000, "schedule_limit": 6})
+    assert first.status_code == 200
+    assert len(response_cache) == 1
+
+    def fail(request):
+        raise AssertionError("cache hit should not recompute")
+
+    monkeypatch.setattr(app_module, "calculate_mortgage", fail)
+    second = post_calculation(client, {"monthly_rent": 3000, "schedule_limit": 6})
+    assert second.status_code == 200
+    assert second.content == first.content
+
+
+def test_calculate_endpoint_normalizes_cache_key(response_cache, monkeypatch):
+    client = TestClient(app)
+    first = post_calculation(client, b'{"schedule_limit":2,"monthly_rent":1000}')
+    assert first.status_code == 200
+
+    def fail(request):
+        raise AssertionError("cache hit should not recompute")
+
+    monkeypatch.setattr(app_module, "calculate_mortgage", fail)
+    second = post_calculation(client, b'{ "monthly_rent": 1000.0,\n  "schedule_limit": 2 }')
+    assert second.content == first.content
+    assert len(response_cache) == 1
+
+
+def test_calculate_endpoint_evicts_least_recently_used(response_cache, monkeypatch):
+    monkeypatch.setattr(app_module, "_RESPONSE_CACHE_SIZE", 2)
+    client = TestClient(app)
+    # Scenario labels of equal length keep every cached response the same size.
+    payloads = [
+        {
+            "schedule_limit": 1,
+            "scenarios": [
+                {
+                    "label": label,
+                    "liens": [
+                        {"percent_of_value": 80, "term_years": 30, "annual_interest_rate": 6.0}
+                    ],
+                }
+            ],
+        }
+        for label in ("A", "B", "C")
+    ]
+    keys = [
+        app_module._request_cache_key(CalculationRequest(**payload)) for payload in payloads
+    ]
+    for payload in (payloads[0], payloads[1], payloads[0], payloads[2]):
+        assert post_calculation(client, payload).status_code == 200
+    assert list(response_cache) == [keys[0], keys[2]]
+
+    monkeypatch.setattr(app_module, "_RESPONSE_CACHE_SIZE", 512)
+    monkeypatch.setattr(
+        app_module, "_RESPONSE_CACHE_MAX_BYTES", 2 * len(response_cache[keys[0]])
+    )
+    post_calculation(client, payloads[1])
+    assert list(response_cache) == [keys[2], keys[1]]
+
+
+def test_calculate_endpoint_rejects_oversized_schedule_limit(response_cache):
+    response = post_calculation(TestClient(app), {"schedule_limit": 5000})
+    assert response.status_code == 422
+    messages = [error["msg"] for error in response.json()["detail"]]
+    assert messages == ["Schedule limit cannot exceed 1200 rows"]
+
+
+def test_calculate_endpoint_skips_errors_and_oversized_bodies(
+    response_cache, monkeypatch
+):
+    client = TestClient(app)
+    assert post_calculation(client, {"schedule_limit": 5000}).status_code == 422
+    assert not response_cache
+
+    monkeypatch.setattr(app_module, "_RESPONSE_CACHE_MAX_BODY_BYTES", 100)
+    assert post_calculation(client, {"schedule_limit": 1}).status_code == 200
+    assert not response_cache
@@ -1,71 +1,86 @@
 """FastAPI web application providing mortgage comparison data and static UI."""
 from __future__ import annotations
 
+from collections import OrderedDict
+from hashlib import blake2b
+from itertools import accumulate, islice, zip_longest
 from pathlib import Path
-from typing import List, Sequence, Literal
+from typing import Iterable, List, Sequence, Literal
 
-from fastapi import FastAPI, HTTPException
-from fastapi.responses import HTMLResponse
+import orjson
+from fastapi import FastAPI, HTTPException, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import HTMLResponse, ORJSONResponse
 from fastapi.staticfiles import StaticFiles
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, root_validator, validator
 
 from .mortgage_calculator import (
-    AmortizationPayment,
+    AmortizationSchedule,
     MortgageScenario,
     generate_amortization_schedule,
-    total_interest,
+    lifetime_interest,
 )
 
 
-def _equity_built(schedule: Sequence[AmortizationPayment], months: int) -> float:
+def _equity_built(schedule: AmortizationSchedule, months: int) -> float:
     """Return total principal paid within the provided horizon."""
-    return sum(payment.principal for payment in schedule[:months])
+    return sum(islice(schedule.principal, max(months, 0)))
 
 
 def _net_cashflow(
-    schedule: Sequence[AmortizationPayment],
+    schedule: AmortizationSchedule,
     monthly_rent: float,
     monthly_costs: float,
     months: int,
 ) -> float:
     """Return total net cashflow (rent - costs - payment) for the horizon."""
-    horizon = min(months, len(schedule))
-    net = 0.0
-    for payment in schedule[:horizon]:
-        net += monthly_rent - monthly_costs - payment.payment
-    return net
+    horizon = max(min(months, len(schedule)), 0)
+    return horizon * (monthly_rent - monthly_costs) - sum(islice(schedule.payment, horizon))
 
 
 def _merge_component_schedules(
-    schedules: Sequence[Sequence[AmortizationPayment]],
-) -> list[AmortizationPayment]:
+    schedules: Sequence[AmortizationSchedule],
+) -> AmortizationSchedule:
     """Combine multiple amortization schedules into a single blended view."""
-    if not schedules:
-        return []
-
-    horizon = max(len(schedule) for schedule in schedules)
-    merged: list[AmortizationPayment] = []
-
-    for idx in range(horizon):
-        payment = principal = interest = balance = 0.0
-        for schedule in schedules:
-            if idx < len(schedule):
-                component_payment = schedule[idx]
-                payment += component_payment.payment
-                principal += component_payment.principal
-                interest += component_payment.interest
-                balance += component_payment.balance
-        merged.append(
-            AmortizationPayment(
-                payment_number=idx + 1,
-                payment=payment,
-                principal=principal,
-                interest=interest,
-                balance=balance,
-            )
-        )
-
-    return merged
+    if len(schedules) == 1:
+        # Schedules are immutable, so a single-lien stack can share its columns.
+        return schedules[0]
+    horizon = max((len(schedule) for schedule in schedules), default=0)
+
+    def merge_column(columns: Iterable[Sequence[float]]) -> list[float]:
+        # Shorter schedules are padded with zeros once they have been paid off.
+        return list(map(sum, zip_longest(*columns, fillvalue=0.0)))
+
+    return AmortizationSchedule(
+        payment_number=range(1, horizon + 1),
+        payment=merge_column(schedule.payment for schedule in schedules),
+        principal=merge_column(schedule.principal for schedule in schedules),
+        interest=merge_column(schedule.interest for schedule in schedules),
+        balance=merge_column(schedule.balance for schedule in schedules),
+    )
+
+
+def _monthly_net_cash(
+    payments: Sequence[float], yearly_operating_income: Sequence[float]
+) -> list[float]:
+    """Return net cash (operating income - mortgage payment) for each month.
+
+    ``yearly_operating_income`` holds the monthly rent minus operating costs in
+    force during each year; it is applied to that year's twelve mortgage
+    payments. Months after the final payment carry no mortgage payment.
+    """
+    months = len(yearly_operating_income) * 12
+    if not any(yearly_operating_income):
+        # Pure mortgage comparisons (no rent or costs) reduce to the payments.
+        paid = [-payment for payment in payments[:months]]
+        return paid + [0.0] * (months - len(paid))
+
+    net_cash: list[float] = []
+    for year, operating_income in enumerate(yearly_operating_income):
+        year_payments = payments[year * 12 : (year + 1) * 12]
+        net_cash.extend(operating_income - payment for payment in year_payments)
+        net_cash.extend([operating_income] * (12 - len(year_payments)))
+    return net_cash
 
 
 DEFAULT_HORIZON_YEARS = (1, 5, 10, 15)
@@ -84,11 +99,11 @@ class LienComponentInput(BaseModel):
         ..., ge=0, description="Lien annual interest rate percentage."
     )
 
-    @validator("amount")
-    def _validate_amount_or_percent(cls, v, values):
-        if v is None and values.get("percent_of_value") is None:
+    @root_validator(skip_on_failure=True)
+    def _validate_amount_or_percent(cls, values):
+        if values.get("amount") is None and values.get("percent_of_value") is None:
             raise ValueError("Either percent_of_value or amount must be provided")
-        return v
+        return values
 
 
 class ScenarioInput(BaseModel):
@@ -118,8 +133,12 @@ class ScenarioInput(BaseModel):
 
     @validator("liens")
     def _validate_percentages(cls, liens: List[LienComponentInput]) -> List[LienComponentInput]:
-        # Validation of total percentage is tricky without property value here.
-        # We will validate it during calculation.
+        # Amount-based liens cannot be converted to a share without the property
+        # value, so only percentage-based liens count toward the total. The
+        # tolerance matches the UI check and absorbs rounding in entered shares.
+        total_percent = sum(lien.percent_of_value or 0 for lien in liens)
+        if total_percent > 100.0001:
+            raise ValueError("Combined lien percentages cannot exceed 100% of the property value")
         return liens
 
 
@@ -164,7 +183,7 @@ class CalculationRequest(BaseModel):
         default_factory=lambda: FutureAssumptions(),
         description="Annual growth assumptions applied to rent, expenses, and property value.",
     )
-    outlook_years: Sequence[int] = Field(
+    outlook_years: List[int] = Field(
         default_factory=lambda: list(DEFAULT_HORIZON_YEARS),
         description="List of years to build horizon snapshots for each scenario.",
     )
@@ -185,7 +204,7 @@ class CalculationRequest(BaseModel):
         return value
 
     @validator("outlook_years", pre=True, always=True)
-    def _validate_outlook_years(cls, value: Sequence[int] | None) -> Sequence[int]:
+    def _validate_outlook_years(cls, value: Sequence[int] | None) -> List[int]:
         source = value or DEFAULT_HORIZON_YEARS
         normalized: list[int] = []
         seen: set[int] = set()
@@ -205,21 +224,27 @@ class CalculationRequest(BaseModel):
         return normalized
 
 
-class PaymentResponse(BaseModel):
-    payment_number: int
-    payment: float
-    principal: float
-    interest: float
-    balance: float
+class ScheduleColumns(BaseModel):
+    """Amortization schedule serialized as parallel columns.
+
+    Index ``i`` of every list describes one payment; sending columns instead of
+    one object per row keeps the field names out of every row of the payload.
+    """
+
+    payment_number: List[int]
+    payment: List[float]
+    principal: List[float]
+    interest: List[float]
+    balance: List[float]
 
     @classmethod
-    def from_payment(cls, payment: AmortizationPayment) -> "PaymentResponse":
-        return cls(
-            payment_number=payment.payment_number,
-            payment=payment.payment,
-            principal=payment.principal,
-            interest=payment.interest,
-            balance=payment.balance,
+    def from_schedule(cls, schedule: AmortizationSchedule) -> "ScheduleColumns":
+        return cls.construct(
+            payment_number=list(schedule.payment_number),
+            payment=list(schedule.payment),
+            principal=list(schedule.principal),
+            interest=list(schedule.interest),
+            balance=list(schedule.balance),
         )
 
 
@@ -370,9 +395,9 @@ class ScenarioSummary(BaseModel):
     cashflow_five_year: float
     cashflow_ten_year: float
     cashflow_fifteen_year: float
-    horizon_outlooks: Sequence[ScenarioHorizonOutlook]
-    components: Sequence["LoanComponentSummary"]
-    schedule: Sequence[PaymentResponse]
+    horizon_outlooks: List[ScenarioHorizonOutlook]
+    components: List["LoanComponentSummary"]
+    schedule: ScheduleColumns
 
 
 class LoanComponentSummary(BaseModel):
@@ -394,37 +419,105 @@ class CalculationResponse(BaseModel):
     property_value: float
     monthly_rent: float
     monthly_operating_costs: float
-    scenarios: Sequence[ScenarioSummary]
+    scenarios: List[ScenarioSummary]
     future_assumptions: FutureAssumptions
 
 
-app = FastAPI(title="Mortgage Comparison Tool", version="1.0.0")
+# Financing stacks compared when a request does not provide its own scenarios.
+_DEFAULT_SCENARIOS: tuple[ScenarioInput, ...] = (
+    ScenarioInput(
+        label="15yr single note",
+        liens=[
+            LienComponentInput(
+                percent_of_value=80,
+                term_years=15,
+                annual_interest_rate=5.5,
+            )
+        ],
+    ),
+    ScenarioInput(
+        label="30yr single note",
+        liens=[
+            LienComponentInput(
+                percent_of_value=80,
+                term_years=30,
+                annual_interest_rate=6.5,
+            )
+        ],
+    ),
+    ScenarioInput(
+        label="5% down primary house hack",
+        liens=[
+            LienComponentInput(
+                percent_of_value=95,
+                term_years=30,
+                annual_interest_rate=6.5,
+            )
+        ],
+    ),
+    ScenarioInput(
+        label="50yr single note",
+        liens=[
+            LienComponentInput(
+                percent_of_value=80,
+                term_years=50,
+                annual_interest_rate=7.0,
+            )
+        ],
+    ),
+    ScenarioInput(
+        label="50/40/10 stacked",
+        liens=[
+            LienComponentInput(
+                percent_of_value=50,
+                term_years=30,
+                annual_interest_rate=7.5,
+            ),
+            LienComponentInput(
+                percent_of_value=40,
+                term_years=30,
+                annual_interest_rate=3.0,
+            ),
+        ],
+    ),
+)
+
+
+app = FastAPI(
+    title="Mortgage Comparison Tool",
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+)
 
 _static_dir = Path(__file__).parent / "static"
 app.mount("/static", StaticFiles(directory=_static_dir), name="static")
 
 
+_index_path = _static_dir / "index.html"
+_INDEX_HTML = _index_path.read_bytes() if _index_path.exists() else None
+
+
 @app.get("/", response_class=HTMLResponse)
-def read_index() -> str:
+def read_index() -> HTMLResponse:
     """Serve the interactive mortgage comparison interface."""
-    index_path = _static_dir / "index.html"
-    if not index_path.exists():  # pragma: no cover - safety check
+    if _INDEX_HTML is None:  # pragma: no cover - safety check
         raise HTTPException(status_code=404, detail="UI not found")
-    return index_path.read_text(encoding="utf-8")
+    return HTMLResponse(content=_INDEX_HTML)
 
 
-@app.post("/api/calculate", response_model=CalculationResponse)
 def calculate_mortgage(request: CalculationRequest) -> CalculationResponse:
     """Calculate mortgage comparisons and amortization schedules."""
-    purchase_price = request.purchase_price or 500_000
-    property_value = request.property_value or purchase_price
-    base_loan_amount = request.loan_amount or purchase_price
+    # Field defaults are ints and skip validation, and the response models are
+    # built with construct(), so request values echoed back are coerced here.
+    purchase_price = float(request.purchase_price or 500_000)
+    property_value = float(request.property_value or purchase_price)
+    base_loan_amount = float(request.loan_amount or purchase_price)
     if request.closing_costs_mode == "percent":
         closing_costs_amount = purchase_price * (request.closing_costs_value / 100)
     else:
         closing_costs_amount = request.closing_costs_value
     closing_costs_amount = max(0.0, closing_costs_amount)
-    monthly_rent = request.monthly_rent
+    monthly_rent = float(request.monthly_rent)
     assumptions = request.future_assumptions or FutureAssumptions()
     rent_growth_rate = assumptions.annual_rent_growth_percent / 100.0
     appreciation_rate = assumptions.annual_property_appreciation_percent / 100.0
@@ -434,73 +527,32 @@ def calculate_mortgage(request: CalculationRequest) -> CalculationResponse:
         expense_inputs = request.expenses
         base_fixed_costs = expense_inputs.fixed_monthly_costs()
         variable_expense_factor = expense_inputs.percent_factor()
-        monthly_operating_costs = expense_inputs.monthly_operating_costs(monthly_rent)
     else:
         base_fixed_costs = request.monthly_operating_costs
         variable_expense_factor = 0.0
-        monthly_operating_costs = request.monthly_operating_costs
-
-    default_structures = [
-        ScenarioInput(
-            label="15yr single note",
-            liens=[
-                LienComponentInput(
-                    percent_of_value=80,
-                    term_years=15,
-                    annual_interest_rate=5.5,
-                )
-            ],
-        ),
-        ScenarioInput(
-            label="30yr single note",
-            liens=[
-                LienComponentInput(
-                    percent_of_value=80,
-                    term_years=30,
-                    annual_interest_rate=6.5,
-                )
-            ],
-        ),
-        ScenarioInput(
-            label="5% down primary house hack",
-            liens=[
-                LienComponentInput(
-                    percent_of_value=95,
-                    term_years=30,
-                    annual_interest_rate=6.5,
-                )
-            ],
-        ),
-        ScenarioInput(
-            label="50yr single note",
-            liens=[
-                LienComponentInput(
-                    percent_of_value=80,
-                    term_years=50,
-                    annual_interest_rate=7.0,
-                )
-            ],
-        ),
-        ScenarioInput(
-            label="50/40/10 stacked",
-            liens=[
-                LienComponentInput(
-                    percent_of_value=50,
-                    term_years=30,
-                    annual_interest_rate=7.5,
-                ),
-                LienComponentInput(
-                    percent_of_value=40,
-                    term_years=30,
-                    annual_interest_rate=3.0,
-                ),
-            ],
-        ),
-    ]
+    monthly_operating_costs = base_fixed_costs + monthly_rent * variable_expense_factor
 
-    scenario_inputs = request.scenarios or default_structures
+    scenario_inputs = request.scenarios or _DEFAULT_SCENARIOS
     scenario_payload: list[ScenarioSummary] = []
-    horizon_years = list(request.outlook_years)
+    # The validator already returns a fresh, de-duplicated list of years.
+    horizon_years = request.outlook_years
+    longest_horizon_years = max(15, max(horizon_years, default=0))
+    longest_term_years = max(
+        (lien.term_years for scenario in scenario_inputs for lien in scenario.liens),
+        default=0,
+    )
+
+    # Growth only compounds yearly and is shared by every scenario, so the
+    # per-year rent, operating income, and property values are tabulated once.
+    yearly_operating_income: list[float] = []
+    for year in range(longest_horizon_years):
+        rent = monthly_rent * ((1 + rent_growth_rate) ** year)
+        fixed = base_fixed_costs * ((1 + expense_inflation_rate) ** year)
+        yearly_operating_income.append(rent - (fixed + rent * variable_expense_factor))
+    property_value_by_year = [
+        property_value * ((1 + appreciation_rate) ** year)
+        for year in range(max(longest_horizon_years, longest_term_years) + 1)
+    ]
 
     for index, scenario in enumerate(scenario_inputs, start=1):
         if not scenario.liens:
@@ -508,8 +560,10 @@ def calculate_mortgage(request: CalculationRequest) -> CalculationResponse:
                 status_code=400, detail="Each scenario must include at least one lien."
             )
         component_summaries: list[LoanComponentSummary] = []
-        component_schedules: list[Sequence[AmortizationPayment]] = []
+        component_schedules: list[AmortizationSchedule] = []
         total_financed = 0.0
+        total_interest_paid = 0.0
+        total_lien_percent = 0.0
 
         for lien_index, lien in enumerate(scenario.liens, start=1):
             if lien.amount is not None:
@@ -518,7 +572,8 @@ def calculate_mortgage(request: CalculationRequest) -> CalculationResponse:
             else:
                 amount = purchase_price * ((lien.percent_of_value or 0) / 100)
                 percent = lien.percent_of_value or 0
-            
+            total_lien_percent += percent
+
             if amount <= 0:
                 continue
             lien_note = MortgageScenario(
@@ -526,17 +581,19 @@ def calculate_mortgage(request: CalculationRequest) -> CalculationResponse:
                 annual_interest_rate=lien.annual_interest_rate,
             )
             lien_schedule = generate_amortization_schedule(amount, lien_note)
+            lien_interest = lifetime_interest(amount, lien_note)
             component_schedules.append(lien_schedule)
             total_financed += amount
+            total_interest_paid += lien_interest
             component_summaries.append(
-                LoanComponentSummary(
+                LoanComponentSummary.construct(
                     label=f"Lien {lien_index}",
                     amount=amount,
                     share_percent=percent,
                     term_years=lien_note.term_years,
                     annual_interest_rate=lien_note.annual_interest_rate,
-                    monthly_payment=lien_schedule[0].payment if lien_schedule else 0.0,
-                    total_interest=total_interest(lien_schedule),
+                    monthly_payment=lien_schedule.payment[0] if lien_schedule else 0.0,
+                    total_interest=lien_interest,
                 )
             )
 
@@ -552,107 +609,79 @@ def calculate_mortgage(request: CalculationRequest) -> CalculationResponse:
             else blended_schedule
         )
 
-        monthly_payment = blended_schedule[0].payment if blended_schedule else 0.0
-        total_interest_paid = sum(total_interest(s) for s in component_schedules)
-
-        def rent_for_month(payment_number: int) -> float:
-            year = (payment_number - 1) // 12
-            return monthly_rent * ((1 + rent_growth_rate) ** year)
-
-        def cost_for_month(payment_number: int) -> float:
-            year = (payment_number - 1) // 12
-            fixed = base_fixed_costs * ((1 + expense_inflation_rate) ** year)
-            return fixed + rent_for_month(payment_number) * variable_expense_factor
+        monthly_payment = blended_schedule.payment[0] if blended_schedule else 0.0
 
-        def mortgage_payment_for_index(payment_index: int) -> float:
-            if payment_index < len(blended_schedule):
-                return blended_schedule[payment_index].payment
-            return 0.0
+        # Running totals up to the longest horizon turn every cashflow snapshot
+        # into a single lookup.
+        net_cash = _monthly_net_cash(blended_schedule.payment, yearly_operating_income)
+        cumulative_cashflow = list(accumulate(net_cash))
 
-        def net_cash_for_month(payment_index: int) -> float:
-            payment_number = payment_index + 1
-            mortgage_payment = mortgage_payment_for_index(payment_index)
-            return rent_for_month(payment_number) - cost_for_month(payment_number) - mortgage_payment
-
-        def sum_cashflows(months: int) -> float:
-            total = 0.0
-            if months <= 0:
-                return total
-            for idx in range(months):
-                total += net_cash_for_month(idx)
-            return total
+        monthly_cashflow = net_cash[0] if blended_schedule else 0.0
+        payment_count = len(blended_schedule)
+        balances = blended_schedule.balance
 
         def balance_after_months(months: int) -> float:
-            if not blended_schedule or months <= 0:
+            if not payment_count or months <= 0:
                 return total_financed
-            idx = min(len(blended_schedule), months) - 1
-            return blended_schedule[idx].balance
-
-        def property_value_after_months(months: int) -> float:
-            years = max(months // 12, 0)
-            return property_value * ((1 + appreciation_rate) ** years)
-
-        def equity_after_months(months: int) -> float:
-            return max(property_value_after_months(months) - balance_after_months(months), 0.0)
-
-        def loan_payoff_after_months(months: int) -> float:
-            balance = balance_after_months(months)
-            payoff = total_financed - balance
-            return max(payoff, 0.0)
-
-        def appreciation_equity_after_months(months: int) -> float:
-            return max(property_value_after_months(months) - total_financed, 0.0)
-
-        monthly_cashflow = net_cash_for_month(0) if blended_schedule else 0.0
-
-        snapshot_cache: dict[int, dict[str, float]] = {}
-
-        def snapshot_for_months(months: int) -> dict[str, float]:
-            key = max(1, months)
-            if key not in snapshot_cache:
-                snapshot_cache[key] = {
-                    "cashflow": sum_cashflows(key),
-                    "equity": equity_after_months(key),
-                    "loan_payoff": loan_payoff_after_months(key),
-                    "appreciation_equity": appreciation_equity_after_months(key),
-                }
-            return snapshot_cache[key]
-
-        def snapshot_for_years(years: int) -> dict[str, float]:
-            return snapshot_for_months(years * 12)
-
-        year_one_snapshot = snapshot_for_years(1)
-        five_year_snapshot = snapshot_for_years(5)
-        ten_year_snapshot = snapshot_for_years(10)
-        fifteen_year_snapshot = snapshot_for_years(15)
-
-        year_one_equity = year_one_snapshot["equity"]
-        five_year_equity = five_year_snapshot["equity"]
-        ten_year_equity = ten_year_snapshot["equity"]
-        fifteen_year_equity = fifteen_year_snapshot["equity"]
-
-        five_year_cashflow = five_year_snapshot["cashflow"]
-        ten_year_cashflow = ten_year_snapshot["cashflow"]
-        fifteen_year_cashflow = fifteen_year_snapshot["cashflow"]
-        total_months = len(blended_schedule)
-        total_equity = equity_after_months(total_months) if total_months else 0.0
+            return balances[min(payment_count, months) - 1]
+
+        # Snapshots are (cashflow, equity, loan_payoff, appreciation_equity)
+        # tuples keyed by month count; several horizons can share one entry.
+        snapshot_cache: dict[int, tuple[float, float, float, float]] = {}
+
+        def snapshot_for_years(years: int) -> tuple[float, float, float, float]:
+            key = max(1, years * 12)
+            snapshot = snapshot_cache.get(key)
+            if snapshot is None:
+                # Balance and property value are looked up once and shared by
+                # every metric in the snapshot.
+                balance = balance_after_months(key)
+                value = property_value_by_year[key // 12]
+                snapshot = snapshot_cache[key] = (
+                    cumulative_cashflow[key - 1],
+                    max(value - balance, 0.0),
+                    max(total_financed - balance, 0.0),
+                    max(value - total_financed, 0.0),
+                )
+            return snapshot
+
+        (
+            _,
+            year_one_equity,
+            loan_payoff_year_one,
+            appreciation_equity_year_one,
+        ) = snapshot_for_years(1)
+        (
+            five_year_cashflow,
+            five_year_equity,
+            loan_payoff_five_year,
+            appreciation_equity_five_year,
+        ) = snapshot_for_years(5)
+        (
+            ten_year_cashflow,
+            ten_year_equity,
+            loan_payoff_ten_year,
+            appreciation_equity_ten_year,
+        ) = snapshot_for_years(10)
+        (
+            fifteen_year_cashflow,
+            fifteen_year_equity,
+            loan_payoff_fifteen_year,
+            appreciation_equity_fifteen_year,
+        ) = snapshot_for_years(15)
+        total_equity = (
+            max(
+                property_value_by_year[payment_count // 12]
+                - balance_after_months(payment_count),
+                0.0,
+            )
+            if payment_count
+            else 0.0
+        )
         interest_to_equity_ratio = (
             total_interest_paid / total_equity if total_equity else float("inf")
         )
 
-        loan_payoff_year_one = year_one_snapshot["loan_payoff"]
-        loan_payoff_five_year = five_year_snapshot["loan_payoff"]
-        loan_payoff_ten_year = ten_year_snapshot["loan_payoff"]
-        loan_payoff_fifteen_year = fifteen_year_snapshot["loan_payoff"]
-
-        appreciation_equity_year_one = year_one_snapshot["appreciation_equity"]
-        appreciation_equity_five_year = five_year_snapshot["appreciation_equity"]
-        appreciation_equity_ten_year = ten_year_snapshot["appreciation_equity"]
-        appreciation_equity_fifteen_year = fifteen_year_snapshot["appreciation_equity"]
-        total_lien_percent = sum(
-            ((lien.amount / property_value * 100) if lien.amount is not None else (lien.percent_of_value or 0))
-            for lien in scenario.liens
-        )
         down_payment_percent = max(0.0, 100.0 - total_lien_percent)
         down_payment_amount = purchase_price * (down_payment_percent / 100)
         total_cash_invested = down_payment_amount + closing_costs_amount
@@ -675,19 +704,21 @@ def calculate_mortgage(request: CalculationRequest) -> CalculationResponse:
             scenario_label = " / ".join(parts) or f"Scenario {index}"
         loan_to_value = total_financed / property_value if property_value else None
 
-        horizon_outlooks = [
-            ScenarioHorizonOutlook(
-                horizon_years=year,
-                cashflow=snapshot_for_years(year)["cashflow"],
-                equity=snapshot_for_years(year)["equity"],
-                loan_payoff=snapshot_for_years(year)["loan_payoff"],
-                appreciation_equity=snapshot_for_years(year)["appreciation_equity"],
+        horizon_outlooks = []
+        for year in horizon_years:
+            cashflow, equity, loan_payoff, appreciation_equity = snapshot_for_years(year)
+            horizon_outlooks.append(
+                ScenarioHorizonOutlook.construct(
+                    horizon_years=year,
+                    cashflow=cashflow,
+                    equity=equity,
+                    loan_payoff=loan_payoff,
+                    appreciation_equity=appreciation_equity,
+                )
             )
-            for year in horizon_years
-        ]
 
         scenario_payload.append(
-            ScenarioSummary(
+            ScenarioSummary.construct(
                 label=scenario_label,
                 total_financed=total_financed,
                 down_payment_amount=down_payment_amount,
@@ -716,11 +747,13 @@ def calculate_mortgage(request: CalculationRequest) -> CalculationResponse:
                 appreciation_equity_fifteen_year=appreciation_equity_fifteen_year,
                 horizon_outlooks=horizon_outlooks,
                 components=component_summaries,
-                schedule=[PaymentResponse.from_payment(p) for p in truncated_schedule],
+                schedule=ScheduleColumns.from_schedule(truncated_schedule),
             )
         )
 
-    return CalculationResponse(
+    # Response models are assembled from already-validated inputs and computed
+    # values, so they are constructed without re-running field validation.
+    return CalculationResponse.construct(
         loan_amount=base_loan_amount,
         property_value=property_value,
         monthly_rent=monthly_rent,
@@ -728,3 +761,60 @@ def calculate_mortgage(request: CalculationRequest) -> CalculationResponse:
         scenarios=scenario_payload,
         future_assumptions=assumptions,
     )
+
+
+# Serialized responses keyed by a digest of the validated request. Results are
+# a pure function of the request, so repeated submissions from the UI skip both
+# the computation and serialization. Only touched from the event loop thread.
+# Requests may carry any number of scenarios, so the cache is bounded by total
+# bytes as well as entries, and oversized bodies are never stored.
+_RESPONSE_CACHE_SIZE = 512
+_RESPONSE_CACHE_MAX_BYTES = 32 * 1024 * 1024
+_RESPONSE_CACHE_MAX_BODY_BYTES = 1024 * 1024
+_response_cache: OrderedDict[bytes, bytes] = OrderedDict()
+_response_cache_bytes = 0
+
+
+def _request_cache_key(request: CalculationRequest) -> bytes:
+    """Return a digest of ``request`` that ignores how its JSON body was formatted.
+
+    Hashing the validated model with sorted keys makes bodies that differ only
+    in whitespace, key order, or ``1`` versus ``1.0`` share one cache entry.
+    """
+    canonical = orjson.dumps(request.dict(), option=orjson.OPT_SORT_KEYS)
+    return blake2b(canonical, digest_size=16).digest()
+
+
+def _cache_response(key: bytes, body: bytes) -> None:
+    """Store ``body`` under ``key``, evicting least recently used entries."""
+    global _response_cache_bytes
+    if len(body) > _RESPONSE_CACHE_MAX_BODY_BYTES or key in _response_cache:
+        return
+    _response_cache[key] = body
+    _response_cache_bytes += len(body)
+    while (
+        len(_response_cache) > _RESPONSE_CACHE_SIZE
+        or _response_cache_bytes > _RESPONSE_CACHE_MAX_BYTES
+    ):
+        _, evicted = _response_cache.popitem(last=False)
+        _response_cache_bytes -= len(evicted)
+
+
+@app.post("/api/calculate", responses={200: {"model": CalculationResponse}})
+async def calculate_mortgage_endpoint(request: CalculationRequest) -> Response:
+    """Serve mortgage comparisons as JSON.
+
+    The response is built by :func:`calculate_mortgage` from validated input, so
+    it is serialized directly instead of being re-validated against the
+    response model. orjson reads each nested model's field dict through
+    ``vars`` rather than going through the much slower ``BaseModel.dict()``.
+    """
+    key = _request_cache_key(request)
+    body = _response_cache.get(key)
+    if body is None:
+        result = await run_in_threadpool(calculate_mortgage, request)
+        body = orjson.dumps(result, default=vars)
+        _cache_response(key, body)
+    else:
+        _response_cache.move_to_end(key)
+    return Response(content=body, media_type=ORJSONResponse.media_type)
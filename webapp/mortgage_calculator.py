@@ -2,12 +2,15 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Iterable, List, Sequence
+from typing import Iterable, Iterator, List, Sequence, overload
 import argparse
+import functools
 import math
+import re
+import sys
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MortgageScenario:
     """Represents a mortgage configuration."""
 
@@ -21,7 +24,7 @@ class MortgageScenario:
         return self.term_years * 12
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AmortizationPayment:
     payment_number: int
     payment: float
@@ -30,104 +33,218 @@ class AmortizationPayment:
     balance: float
 
 
+@dataclass(frozen=True, slots=True)
+class AmortizationSchedule:
+    """Column-oriented amortization schedule.
+
+    Each attribute holds one column of the table; index ``i`` across all columns
+    describes a single payment. Indexing with an integer returns that row as an
+    :class:`AmortizationPayment`, while slicing returns a shorter schedule.
+    """
+
+    payment_number: Sequence[int]
+    payment: Sequence[float]
+    principal: Sequence[float]
+    interest: Sequence[float]
+    balance: Sequence[float]
+
+    def __len__(self) -> int:
+        return len(self.payment_number)
+
+    @overload
+    def __getitem__(self, index: int) -> AmortizationPayment:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "AmortizationSchedule":
+        ...
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return AmortizationSchedule(
+                payment_number=self.payment_number[index],
+                payment=self.payment[index],
+                principal=self.principal[index],
+                interest=self.interest[index],
+                balance=self.balance[index],
+            )
+        return AmortizationPayment(
+            payment_number=self.payment_number[index],
+            payment=self.payment[index],
+            principal=self.principal[index],
+            interest=self.interest[index],
+            balance=self.balance[index],
+        )
+
+    def __iter__(self) -> Iterator[AmortizationPayment]:
+        return map(
+            AmortizationPayment,
+            self.payment_number,
+            self.payment,
+            self.principal,
+            self.interest,
+            self.balance,
+        )
+
+
+@functools.lru_cache(maxsize=1024)
+def _payment_multiplier(rate: float, periods: int) -> float:
+    """Return the level payment per dollar borrowed for a monthly rate and term."""
+    if rate == 0:
+        return 1.0 / periods
+    factor = (1.0 + rate) ** periods
+    return rate * factor / (factor - 1.0)
+
+
 def calculate_monthly_payment(loan_amount: float, scenario: MortgageScenario) -> float:
-    """Calculate the constant monthly payment for a mortgage."""
-    rate = scenario.monthly_interest_rate()
-    periods = scenario.total_payments()
+    """Calculate the constant monthly payment for a mortgage.
+
+    The per-dollar multiplier only depends on the rate and term, so it is cached
+    and shared across every loan amount priced against the same scenario.
+    """
+    return loan_amount * _payment_multiplier(
+        scenario.monthly_interest_rate(), scenario.total_payments()
+    )
+
+
+def _amortize_core(
+    loan_amount: float, rate: float, periods: int, payment: float
+) -> tuple[List[float], List[float], List[float], List[float]]:
+    """Run the amortization recurrence on plain floats.
+
+    Kept free of scenario objects so the loop body only touches local scalars.
+    """
+    last = periods - 1
+    payments = [payment] * periods
+    interests = [0.0] * periods
+    balances = [0.0] * periods
+
     if rate == 0:
-        return loan_amount / periods
-    numerator = loan_amount * rate * math.pow(1 + rate, periods)
-    denominator = math.pow(1 + rate, periods) - 1
-    return numerator / denominator
+        principals = [payment] * periods
+        for n in range(last):
+            balances[n] = loan_amount - payment * (n + 1)
+        balance = loan_amount - payment * last
+    else:
+        principals = [0.0] * periods
+        balance = loan_amount
+        for n in range(last):
+            interest_payment = balance * rate
+            principal_payment = payment - interest_payment
+            balance -= principal_payment
+            principals[n] = principal_payment
+            interests[n] = interest_payment
+            balances[n] = balance
+
+    # The balance only reaches zero at the final payment, which absorbs any
+    # floating point drift accumulated over the earlier months.
+    interest_payment = balance * rate
+    payments[last] = balance + interest_payment
+    principals[last] = balance
+    interests[last] = interest_payment
+
+    return payments, principals, interests, balances
 
 
+def generate_amortization_arrays(
+    loan_amount: float, scenario: MortgageScenario
+) -> tuple[List[float], List[float], List[float], List[float]]:
+    """Return the payment, principal, interest, and balance columns of a schedule.
+
+    Column ``i`` of each list describes payment number ``i + 1``. Callers that only
+    aggregate over the schedule can use these directly instead of per-row objects.
+    """
+    return _amortize_core(
+        loan_amount,
+        scenario.monthly_interest_rate(),
+        scenario.total_payments(),
+        calculate_monthly_payment(loan_amount, scenario),
+    )
+
+
+@functools.lru_cache(maxsize=128)
 def generate_amortization_schedule(
     loan_amount: float, scenario: MortgageScenario
-) -> List[AmortizationPayment]:
-    """Generate the full amortization schedule for the given scenario."""
-    balance = loan_amount
-    payment = calculate_monthly_payment(loan_amount, scenario)
-    schedule: List[AmortizationPayment] = []
-    rate = scenario.monthly_interest_rate()
+) -> AmortizationSchedule:
+    """Generate the full amortization schedule for the given scenario.
+
+    Schedules are memoized by ``(loan_amount, scenario)``; the columns are stored
+    as tuples so a cached schedule cannot be modified by one of its callers.
+    """
+    payments, principals, interests, balances = generate_amortization_arrays(
+        loan_amount, scenario
+    )
+    return AmortizationSchedule(
+        payment_number=range(1, len(payments) + 1),
+        payment=tuple(payments),
+        principal=tuple(principals),
+        interest=tuple(interests),
+        balance=tuple(balances),
+    )
 
-    for n in range(1, scenario.total_payments() + 1):
-        if rate == 0:
-            interest_payment = 0.0
-        else:
-            interest_payment = balance * rate
-        principal_payment = payment - interest_payment
-
-        # Ensure the final payment zeroes the balance to avoid floating point drift
-        if n == scenario.total_payments():
-            principal_payment = balance
-            payment_amount = principal_payment + interest_payment
-            balance = 0.0
-        else:
-            balance = max(balance - principal_payment, 0.0)
-            payment_amount = payment
-
-        schedule.append(
-            AmortizationPayment(
-                payment_number=n,
-                payment=payment_amount,
-                principal=principal_payment,
-                interest=interest_payment,
-                balance=balance,
-            )
-        )
 
-    return schedule
+def total_interest(schedule: AmortizationSchedule) -> float:
+    return math.fsum(schedule.interest)
 
 
-def total_interest(schedule: Sequence[AmortizationPayment]) -> float:
-    return sum(p.interest for p in schedule)
+def lifetime_interest(loan_amount: float, scenario: MortgageScenario) -> float:
+    """Return the interest paid over the full term without building a schedule.
+
+    Every payment is level, so the interest is simply what is paid beyond the
+    principal.
+    """
+    if scenario.monthly_interest_rate() == 0:
+        return 0.0
+    payment = calculate_monthly_payment(loan_amount, scenario)
+    return payment * scenario.total_payments() - loan_amount
 
 
 def summarize_scenarios(
     loan_amount: float, scenarios: Iterable[MortgageScenario]
 ) -> List[tuple[MortgageScenario, float, float]]:
-    """Return the payment and total interest for each scenario."""
-    summary = []
-    for scenario in scenarios:
-        schedule = generate_amortization_schedule(loan_amount, scenario)
-        payment = schedule[0].payment
-        interest_paid = total_interest(schedule)
-        summary.append((scenario, payment, interest_paid))
-    return summary
+    """Return the payment and total interest for each scenario.
+
+    Both values have closed forms, so no amortization schedule is built here.
+    """
+    return [
+        (
+            scenario,
+            calculate_monthly_payment(loan_amount, scenario),
+            lifetime_interest(loan_amount, scenario),
+        )
+        for scenario in scenarios
+    ]
+
+
+_CURRENCY_FMT = "$ {:,.2f}".format
+_SCENARIO_SEP = re.compile(r"[@,:]")
 
 
 def format_currency(value: float) -> str:
-    return f"$ {value:,.2f}"
+    return _CURRENCY_FMT(value)
 
 
 def print_summary_table(summary: Sequence[tuple[MortgageScenario, float, float]]) -> None:
-    print("Mortgage Comparison Summary")
-    print("=" * 80)
     header = (
         f"{'Term (yrs)':>12}"
         f"{'Rate':>12}"
         f"{'Monthly Payment':>20}"
         f"{'Total Interest':>20}"
     )
-    print(header)
-    print("-" * 80)
-    for scenario, payment, total_int in summary:
-        print(
-            f"{scenario.term_years:>12}"
-            f"{scenario.annual_interest_rate:>12.2f}%"
-            f"{format_currency(payment):>20}"
-            f"{format_currency(total_int):>20}"
-        )
-    print()
+    lines = ["Mortgage Comparison Summary", "=" * 80, header, "-" * 80]
+    lines.extend(
+        f"{scenario.term_years:>12}"
+        f"{scenario.annual_interest_rate:>12.2f}%"
+        f"{format_currency(payment):>20}"
+        f"{format_currency(total_int):>20}"
+        for scenario, payment, total_int in summary
+    )
+    lines.append("")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def print_amortization_schedule(
-    scenario: MortgageScenario, schedule: Sequence[AmortizationPayment]
+    scenario: MortgageScenario, schedule: AmortizationSchedule
 ) -> None:
-    print(
-        f"Amortization Schedule - {scenario.term_years}-year @ {scenario.annual_interest_rate:.3f}%"
-    )
-    print("=" * 80)
     header = (
         f"{'#':>6}"
         f"{'Payment':>14}"
@@ -135,22 +252,34 @@ def print_amortization_schedule(
         f"{'Interest':>14}"
         f"{'Balance':>14}"
     )
-    print(header)
-    print("-" * 80)
-    for payment in schedule:
-        print(
-            f"{payment.payment_number:>6}"
-            f"{format_currency(payment.payment):>14}"
-            f"{format_currency(payment.principal):>14}"
-            f"{format_currency(payment.interest):>14}"
-            f"{format_currency(payment.balance):>14}"
+    lines = [
+        f"Amortization Schedule - {scenario.term_years}-year @ {scenario.annual_interest_rate:.3f}%",
+        "=" * 80,
+        header,
+        "-" * 80,
+    ]
+    currency = _CURRENCY_FMT
+    lines.extend(
+        f"{number:>6}"
+        f"{currency(payment):>14}"
+        f"{currency(principal):>14}"
+        f"{currency(interest):>14}"
+        f"{currency(balance):>14}"
+        for number, payment, principal, interest, balance in zip(
+            schedule.payment_number,
+            schedule.payment,
+            schedule.principal,
+            schedule.interest,
+            schedule.balance,
         )
-    print()
+    )
+    lines.append("")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def parse_scenario(text: str) -> MortgageScenario:
     try:
-        parts = text.replace("@", ":").replace(",", ":").split(":")
+        parts = _SCENARIO_SEP.split(text, maxsplit=1)
         if len(parts) != 2:
             raise ValueError
         term_years = int(parts[0])
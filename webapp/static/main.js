@@ -228,6 +228,16 @@ function setSelectedOutlookYears(years) {
   renderOutlookChips();
 }
 
+function scheduleRows(columns) {
+  return columns.payment_number.map((paymentNumber, i) => ({
+    payment_number: paymentNumber,
+    payment: columns.payment[i],
+    principal: columns.principal[i],
+    interest: columns.interest[i],
+    balance: columns.balance[i],
+  }));
+}
+
 function sampleSchedule(schedule, maxPoints = 720) {
   if (schedule.length <= maxPoints) {
     return schedule;
@@ -1017,9 +1027,10 @@ function updateScenarioDetails(index) {
   if (!mortgageData) return;
   const scenario = mortgageData.scenarios[index];
   if (!scenario) return;
-  buildScheduleTable(scenario.schedule);
-  updateBalanceChart(scenario.schedule);
-  updateCompositionChart(scenario.schedule);
+  const schedule = scheduleRows(scenario.schedule);
+  buildScheduleTable(schedule);
+  updateBalanceChart(schedule);
+  updateCompositionChart(schedule);
 
   const summaryRows = summaryTable?.querySelectorAll('tr');
   if (summaryRows) {